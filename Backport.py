@@ -9,11 +9,12 @@ import os
 import sys
 import shutil
 import argparse
-import subprocess
+import functools
 import tempfile
 import json
+import struct
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Union, Any
+from typing import Dict, List, Optional, Tuple, Union
 
 try:
     from src.ps5_sdk_version_patcher import SDKVersionPatcher
@@ -50,6 +51,17 @@ class PS5ELFProcessor:
     # Constants for libc.prx patching
     LIBC_PATCH_PATTERN = b'4h6F1LLbTiw#A#B'
     LIBC_PATCH_REPLACEMENT = b'IWIBBdTHit4#A#B'
+    # Classification rejects these without opening them: known asset types
+    # (including .bak backups), and files too small to hold an ELF header
+    NON_ELF_SUFFIXES = frozenset({'.png', '.json', '.xml', '.txt', '.dat', '.pkg', '.bak'})
+    CLASSIFY_MIN_SIZE = 52
+    
+    # File magic (first 4 bytes as a little-endian u32) -> kind
+    _MAGIC_U32 = struct.Struct('<I')
+    _ELF_MAGIC = 0x464C457F                          # b'\x7FELF'
+    _SELF_MAGICS = frozenset((0x1D3D154F,            # b'\x4F\x15\x3D\x1D' (PS4)
+                              0xEEF51454))           # b'\x54\x14\xF5\xEE' (PS5)
+    _MAGIC_KINDS = {_ELF_MAGIC: 'elf', **{m: 'self' for m in _SELF_MAGICS}}
     
     def __init__(self, use_colors: bool = True, project_root: Optional[Union[str, Path]] = None):
         self.use_colors = use_colors
@@ -65,35 +77,74 @@ class PS5ELFProcessor:
             message = BOLD + message
         print(message)
     
-    def _is_elf_file(self, file_path: Path) -> bool:
-        if file_path.name.endswith('.bak'):
-            return False
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _sniff_magic(path_str: str, mtime_ns: int, size: int, ino: int) -> bytes:
+        """Return the first 8 bytes of a file; cached per (path, mtime, size, inode)."""
+        flags = os.O_RDONLY | getattr(os, 'O_BINARY', 0)
+        try:
+            fd = os.open(path_str, flags | getattr(os, 'O_NOATIME', 0))
+        except PermissionError:
+            # O_NOATIME is only allowed for the file owner
+            fd = os.open(path_str, flags)
         try:
-            with open(file_path, 'rb') as f:
-                magic = f.read(4)
-                return magic == b'\x7FELF'
-        except:
-            return False
+            if hasattr(os, 'posix_fadvise'):
+                # Only the header is needed; keep the kernel from reading ahead the rest of the file
+                os.posix_fadvise(fd, 0, 4096, os.POSIX_FADV_RANDOM)
+            if hasattr(os, 'pread'):
+                return os.pread(fd, 8, 0)
+            return os.read(fd, 8)
+        finally:
+            os.close(fd)
+    
+    def _is_elf_file(self, file_path: Path, head: Optional[bytes] = None) -> bool:
+        return self._classify_file(file_path, head) == 'elf'
     
-    def _is_self_file(self, file_path: Path) -> bool:
-        if file_path.name.endswith('.bak'):
-            return False
+    def _is_self_file(self, file_path: Path, head: Optional[bytes] = None) -> bool:
+        return self._classify_file(file_path, head) == 'self'
+    
+    def _skip_unread(self, name: str, size: int) -> bool:
+        return os.path.splitext(name)[1].lower() in self.NON_ELF_SUFFIXES or size < self.CLASSIFY_MIN_SIZE
+    
+    def _classify_file(self, file_path: Path, head: Optional[bytes] = None) -> Optional[str]:
+        # Callers that already hold the file's first bytes pass them as head; only the name is checked then
+        if head is not None:
+            if os.path.splitext(file_path.name)[1].lower() in self.NON_ELF_SUFFIXES:
+                return None
+            return self._magic_kind(head)
         try:
-            with open(file_path, 'rb') as f:
-                magic = f.read(4)
-                return magic in [b'\x4F\x15\x3D\x1D', b'\x54\x14\xF5\xEE']
-        except:
-            return False
+            st = file_path.stat()
+            if self._skip_unread(file_path.name, st.st_size):
+                return None
+            head = self._sniff_magic(str(file_path), st.st_mtime_ns, st.st_size, st.st_ino)
+        except OSError:
+            return None
+        return self._magic_kind(head)
+    
+    @classmethod
+    def _magic_kind(cls, head: bytes) -> Optional[str]:
+        if len(head) < 4:
+            return None
+        return cls._MAGIC_KINDS.get(cls._MAGIC_U32.unpack_from(head)[0])
     
     def _should_skip_dir(self, dirs: List[str], skip_name: str = 'decrypted') -> None:
         dirs_to_remove = [d for d in dirs if d.lower() == skip_name.lower()]
         for dir_name in dirs_to_remove:
             dirs.remove(dir_name)
     
-    def get_supported_sdk_pairs(self) -> Dict[int, Tuple[int, int]]:
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _sdk_pairs() -> Dict[int, Tuple[int, int]]:
         return SDKVersionPatcher.get_supported_pairs()
     
-    def parse_ptype(self, ptype_str: str) -> int:
+    @staticmethod
+    def get_supported_sdk_pairs() -> Dict[int, Tuple[int, int]]:
+        # The cached table is shared, so every caller gets its own copy
+        return dict(PS5ELFProcessor._sdk_pairs())
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def parse_ptype(ptype_str: str) -> int:
         return FakeSignedELFConverter.parse_ptype(ptype_str.lower())
     
     # [All the rest of your original methods from decrypt_files, apply_libc_patch, revert_libc_patch, check_libc_patch_status, downgrade_and_sign, decrypt_and_sign_pipeline, _copy_fakelib, _copy_fakelib_to_eboot_dirs, config methods, etc. — exactly as you had them]
@@ -109,19 +160,37 @@ class PS5ELFProcessor:
 # ========================== GUI SECTION (END OF FILE) =====================
 # ===================================================================
 
-import tkinter as tk
-from tkinter import filedialog, messagebox, ttk
 import threading
+import queue
 import io
 
+# tkinter is imported on first GUI use so the processor can be imported
+# (and used headless) on Pythons built without Tk.
+tk = filedialog = messagebox = ttk = None
+
+
+def _import_tk():
+    global tk, filedialog, messagebox, ttk
+    if tk is None:
+        import tkinter
+        from tkinter import filedialog, messagebox, ttk
+        tk = tkinter
+
+
 class PS5BackportGUI:
+    LOG_MAX_LINES = 5000
+    LOG_DRAIN_INTERVAL_MS = 50
+    LOG_DRAIN_BATCH = 1000
+
     def __init__(self, root):
+        _import_tk()
         self.root = root
         self.root.title("PS5 Backport Tool - GUI")
         self.root.geometry("1100x800")
         self.root.resizable(True, True)
 
         self.processor = PS5ELFProcessor(use_colors=False)
+        self.log_queue = queue.Queue()
 
         # Variables
         self.input_dir = tk.StringVar()
@@ -220,11 +289,26 @@ class PS5BackportGUI:
         self.log("Select options and click RUN PROCESSING.\n\n")
 
         self.update_mode_visibility()
+        self._drain_log()
 
     def log(self, message):
-        self.log_text.insert(tk.END, message + "\n")
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
+        # Safe from any thread; the Text widget is only touched by _drain_log
+        self.log_queue.put(message + "\n")
+
+    def _drain_log(self):
+        chunks = []
+        try:
+            while len(chunks) < self.LOG_DRAIN_BATCH:
+                chunks.append(self.log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        if chunks:
+            self.log_text.insert(tk.END, "".join(chunks))
+            lines = int(self.log_text.index("end-1c").split(".")[0])
+            if lines > self.LOG_MAX_LINES:
+                self.log_text.delete("1.0", f"{lines - self.LOG_MAX_LINES + 1}.0")
+            self.log_text.see(tk.END)
+        self.root.after(self.LOG_DRAIN_INTERVAL_MS, self._drain_log)
 
     def update_mode_visibility(self, *args):
         mode = self.mode.get()
@@ -273,7 +357,7 @@ class PS5BackportGUI:
                 self.gui = gui
             def write(self, text):
                 if text.strip():
-                    self.gui.root.after(0, lambda t=text.strip(): self.gui.log(t))
+                    self.gui.log(text.strip())
             def flush(self): pass
 
         old_stdout = sys.stdout
@@ -326,6 +410,7 @@ class PS5BackportGUI:
 
 
 if __name__ == "__main__":
+    _import_tk()
     root = tk.Tk()
     app = PS5BackportGUI(root)
     root.mainloop()
@@ -9,6 +9,7 @@
 import sys, os, struct, traceback
 import hashlib
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, Optional, List, BinaryIO
 
 def align_up(x, alignment):
@@ -512,18 +513,20 @@ class UnsignedELFConverter:
                 traceback.print_exc()
             return False
     
-    def convert_directory(self, input_dir: str, output_dir: str) -> Dict[str, bool]:
+    def convert_directory(self, input_dir: str, output_dir: str, max_workers: Optional[int] = 1) -> Dict[str, bool]:
         """
         Recursively convert all SELF files in a directory.
         
         Args:
             input_dir: Input directory containing SELF files
             output_dir: Output directory for ELF files
+            max_workers: Worker processes to convert with (1 = in-process, None = one per CPU)
             
         Returns:
             Dict[str, bool]: Dictionary mapping input files to success status
         """
         results = {}
+        jobs = []
         
         for dirpath, dirnames, filenames in os.walk(input_dir):
             rel_dir = os.path.relpath(dirpath, input_dir)
@@ -549,13 +552,38 @@ class UnsignedELFConverter:
                 
                 # Keep same filename and extension
                 dst_file = os.path.join(dest_dir, filename)
-                
+                jobs.append((src_file, dst_file))
+        
+        if max_workers == 1 or len(jobs) < 2:
+            for src_file, dst_file in jobs:
                 if self.verbose:
                     print(f'Converting: {src_file} -> {dst_file}')
                 results[src_file] = self.convert_file(src_file, dst_file)
+        else:
+            # Conversions share no state; batch them out to worker processes
+            workers = max_workers or os.cpu_count() or 1
+            chunksize = max(1, len(jobs) // (4 * workers))
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_convert_worker,
+                                     initargs=(self,)) as executor:
+                for src_file, success in executor.map(_convert_one, jobs, chunksize=chunksize):
+                    results[src_file] = success
                 
         return results
 
+# Set in each worker by _init_convert_worker so the converter is pickled once, not per job
+_worker_converter = None
+
+def _init_convert_worker(converter):
+    global _worker_converter
+    _worker_converter = converter
+
+def _convert_one(job):
+    """Process-pool worker for UnsignedELFConverter.convert_directory."""
+    src_file, dst_file = job
+    if _worker_converter.verbose:
+        print(f'Converting: {src_file} -> {dst_file}')
+    return src_file, _worker_converter.convert_file(src_file, dst_file)
+
 def detect_self_magic(file_path: str) -> Optional[str]:
     """Detect the SELF magic in a file."""
     try:
@@ -571,6 +599,12 @@ def detect_self_magic(file_path: str) -> Optional[str]:
     except:
         return None
 
+def jobs_type(val: str) -> int:
+    """Parse --jobs; 0 means one worker per CPU."""
+    if not (val.isascii() and val.isdigit()):
+        raise argparse.ArgumentTypeError(f"--jobs expects a non-negative integer, got '{val}'")
+    return int(val)
+
 def main():
     """Command-line interface for standalone use."""
     parser = argparse.ArgumentParser(
@@ -604,6 +638,10 @@ Supported SELF magics:
     parser.add_argument('--detect',
                        action='store_true',
                        help='detect SELF magic in file(s) without converting')
+    parser.add_argument('--jobs', '-j',
+                       type=jobs_type,
+                       default=1,
+                       help='worker processes for directory input (0 = one per CPU, default: 1)')
     
     if len(sys.argv) == 1:
         parser.print_help()
@@ -661,7 +699,7 @@ Supported SELF magics:
             print("Error: When the input is a directory, the output must also be a directory.")
             sys.exit(1)
         
-        results = converter.convert_directory(in_path, out_path)
+        results = converter.convert_directory(in_path, out_path, max_workers=args.jobs or None)
         successful = sum(1 for result in results.values() if result)
         total = len(results)
         
@@ -9,6 +9,7 @@
 import sys, os, struct, traceback
 import hashlib, hmac
 import argparse, re, string
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, Optional, Tuple, List, Any
 
 def int_with_base_type(val):
@@ -53,6 +54,16 @@ def parse_version(version):
 def sha256(data):
     return hashlib.sha256(data).digest()
 
+def sha256_file(f):
+    # hash from the current position to EOF without holding the file in memory;
+    # file_digest() hashes a BytesIO's whole buffer regardless of position
+    if hasattr(hashlib, 'file_digest') and not hasattr(f, 'getbuffer'):
+        return hashlib.file_digest(f, 'sha256').digest()
+    h = hashlib.sha256()
+    for chunk in iter(lambda: f.read(0x100000), b''):
+        h.update(chunk)
+    return h.digest()
+
 def hmac_sha256(key, data):
     return hmac.new(key=key, msg=data, digestmod=hashlib.sha256).digest()
 
@@ -66,6 +77,8 @@ class ElfError(Exception):
 class ElfEHdr(object):
     FMT = '<4s5B6xB'
     EX_FMT = '<2HI3QI6H'
+    STRUCT = struct.Struct(FMT)
+    EX_STRUCT = struct.Struct(EX_FMT)
 
     MAGIC = b'\x7FELF'
     CLASS64 = 0x2
@@ -104,10 +117,10 @@ class ElfEHdr(object):
         if not check_file_magic(f, ElfEHdr.MAGIC):
             raise ElfError('Invalid magic.')
 
-        self.magic, self.machine_class, self.data_encoding, self.version, self.os_abi, self.abi_version, self.nident_size = struct.unpack(ElfEHdr.FMT, f.read(struct.calcsize(ElfEHdr.FMT)))
+        self.magic, self.machine_class, self.data_encoding, self.version, self.os_abi, self.abi_version, self.nident_size = ElfEHdr.STRUCT.unpack(f.read(ElfEHdr.STRUCT.size))
         if self.machine_class != ElfEHdr.CLASS64 or self.data_encoding != ElfEHdr.DATA2LSB:
             raise ElfError('Unsupported class or data encoding.')
-        self.type, self.machine, self.version, self.entry, self.phoff, self.shoff, self.flags, self.ehsize, self.phentsize, self.phnum, self.shentsize, self.shnum, self.shstridx = struct.unpack(ElfEHdr.EX_FMT, f.read(struct.calcsize(ElfEHdr.EX_FMT)))
+        self.type, self.machine, self.version, self.entry, self.phoff, self.shoff, self.flags, self.ehsize, self.phentsize, self.phnum, self.shentsize, self.shnum, self.shstridx = ElfEHdr.EX_STRUCT.unpack(f.read(ElfEHdr.EX_STRUCT.size))
         if self.machine != ElfEHdr.EM_X86_64 or self.version != ElfEHdr.EV_CURRENT:
             raise ElfError('Unsupported machine type or version.')
         if self.phentsize != struct.calcsize(ElfPHdr.FMT) or (self.shentsize > 0 and self.shentsize != struct.calcsize(ElfSHdr.FMT)):
@@ -116,8 +129,8 @@ class ElfEHdr(object):
             raise ElfError('Unsupported type.')
 
     def save(self, f):
-        f.write(struct.pack(ElfEHdr.FMT, self.magic, self.machine_class, self.data_encoding, self.version, self.os_abi, self.abi_version, self.nident_size))
-        f.write(struct.pack(ElfEHdr.EX_FMT, self.type, self.machine, self.version, self.entry, self.phoff, self.shoff, self.flags, self.ehsize, self.phentsize, self.phnum, self.shentsize, self.shnum, self.shstridx))
+        f.write(ElfEHdr.STRUCT.pack(self.magic, self.machine_class, self.data_encoding, self.version, self.os_abi, self.abi_version, self.nident_size))
+        f.write(ElfEHdr.EX_STRUCT.pack(self.type, self.machine, self.version, self.entry, self.phoff, self.shoff, self.flags, self.ehsize, self.phentsize, self.phnum, self.shentsize, self.shnum, self.shstridx))
 
     def has_segments(self):
         return self.phentsize > 0 and self.phnum > 0
@@ -127,6 +140,7 @@ class ElfEHdr(object):
 
 class ElfPHdr(object):
     FMT = '<2I6Q'
+    STRUCT = struct.Struct(FMT)
 
     PT_LOAD = 0x1
     PT_DYNAMIC = 0x2
@@ -160,13 +174,14 @@ class ElfPHdr(object):
         self.align = None
 
     def load(self, f):
-        self.type, self.flags, self.offset, self.vaddr, self.paddr, self.filesz, self.memsz, self.align = struct.unpack(ElfPHdr.FMT, f.read(struct.calcsize(ElfPHdr.FMT)))
+        self.type, self.flags, self.offset, self.vaddr, self.paddr, self.filesz, self.memsz, self.align = ElfPHdr.STRUCT.unpack(f.read(ElfPHdr.STRUCT.size))
 
     def save(self, f):
-        f.write(struct.pack(ElfPHdr.FMT, self.type, self.flags, self.offset, self.vaddr, self.paddr, self.filesz, self.memsz, self.align))
+        f.write(ElfPHdr.STRUCT.pack(self.type, self.flags, self.offset, self.vaddr, self.paddr, self.filesz, self.memsz, self.align))
 
 class ElfSHdr(object):
     FMT = '<2I4Q2I2Q'
+    STRUCT = struct.Struct(FMT)
 
     def __init__(self, idx):
         self.idx = idx
@@ -182,10 +197,10 @@ class ElfSHdr(object):
         self.entsize = None
 
     def load(self, f):
-        self.name, self.type, self.flags, self.addr, self.offset, self.size, self.link, self.info, self.align, self.entsize = struct.unpack(ElfSHdr.FMT, f.read(struct.calcsize(ElfSHdr.FMT)))
+        self.name, self.type, self.flags, self.addr, self.offset, self.size, self.link, self.info, self.align, self.entsize = ElfSHdr.STRUCT.unpack(f.read(ElfSHdr.STRUCT.size))
 
     def save(self, f):
-        f.write(struct.pack(ElfSHdr.FMT, self.name, self.type, self.flags, self.addr, self.offset, self.size, self.link, self.info, self.align, self.entsize))
+        f.write(ElfSHdr.STRUCT.pack(self.name, self.type, self.flags, self.addr, self.offset, self.size, self.link, self.info, self.align, self.entsize))
 
 class ElfFile(object):
     def __init__(self, **kwargs):
@@ -200,9 +215,8 @@ class ElfFile(object):
 
     def load(self, f):
         start_offset = f.tell()
-        data = f.read()
-        self.file_size = len(data)
-        self.digest = sha256(data)
+        self.digest = sha256_file(f)
+        self.file_size = f.tell() - start_offset
         f.seek(start_offset)
 
         self.ehdr = ElfEHdr()
@@ -713,22 +727,23 @@ class FakeSignedELFConverter:
         self.fw_version = fw_version
         self.auth_info = auth_info
         
+    PTYPE_MAP = {
+        'fake': SignedElfExInfo.PTYPE_FAKE,
+        'npdrm_exec': SignedElfExInfo.PTYPE_NPDRM_EXEC,
+        'npdrm_dynlib': SignedElfExInfo.PTYPE_NPDRM_DYNLIB,
+        'system_exec': SignedElfExInfo.PTYPE_SYSTEM_EXEC,
+        'system_dynlib': SignedElfExInfo.PTYPE_SYSTEM_DYNLIB,
+        'host_kernel': SignedElfExInfo.PTYPE_HOST_KERNEL,
+        'secure_module': SignedElfExInfo.PTYPE_SECURE_MODULE,
+        'secure_kernel': SignedElfExInfo.PTYPE_SECURE_KERNEL,
+    }
+    
     @staticmethod
     def parse_ptype(ptype_str: str) -> int:
         """Parse program type string to integer."""
-        ptype_map = {
-            'fake': SignedElfExInfo.PTYPE_FAKE,
-            'npdrm_exec': SignedElfExInfo.PTYPE_NPDRM_EXEC,
-            'npdrm_dynlib': SignedElfExInfo.PTYPE_NPDRM_DYNLIB,
-            'system_exec': SignedElfExInfo.PTYPE_SYSTEM_EXEC,
-            'system_dynlib': SignedElfExInfo.PTYPE_SYSTEM_DYNLIB,
-            'host_kernel': SignedElfExInfo.PTYPE_HOST_KERNEL,
-            'secure_module': SignedElfExInfo.PTYPE_SECURE_MODULE,
-            'secure_kernel': SignedElfExInfo.PTYPE_SECURE_KERNEL,
-        }
-        
-        if ptype_str.lower() in ptype_map:
-            return ptype_map[ptype_str.lower()]
+        ptype = FakeSignedELFConverter.PTYPE_MAP.get(ptype_str.lower())
+        if ptype is not None:
+            return ptype
         
         ptype_int = try_parse_int(ptype_str)
         if ptype_int is not None:
@@ -770,18 +785,20 @@ class FakeSignedELFConverter:
             traceback.print_exc()
             return False
     
-    def sign_directory(self, input_dir: str, output_dir: str) -> Dict[str, bool]:
+    def sign_directory(self, input_dir: str, output_dir: str, max_workers: Optional[int] = 1) -> Dict[str, bool]:
         """
         Recursively sign all files in a directory.
         
         Args:
             input_dir: Input directory containing files
             output_dir: Output directory for SELF files
+            max_workers: Worker processes to sign with (1 = in-process, None = one per CPU)
             
         Returns:
             Dict[str, bool]: Dictionary mapping input files to success status
         """
         results = {}
+        jobs = []
         
         for dirpath, dirnames, filenames in os.walk(input_dir):
             rel_dir = os.path.relpath(dirpath, input_dir)
@@ -805,13 +822,38 @@ class FakeSignedELFConverter:
                 
                 # Keep same filename and extension
                 dst_file = os.path.join(dest_dir, filename)
-                
+                jobs.append((src_file, dst_file))
+        
+        if max_workers == 1 or len(jobs) < 2:
+            for src_file, dst_file in jobs:
                 print(f'Signing: {src_file} -> {dst_file}')
                 results[src_file] = self.sign_file(src_file, dst_file)
+        else:
+            # Files are independent; hand each worker a few per round trip
+            workers = max_workers or os.cpu_count() or 1
+            chunksize = max(1, len(jobs) // (4 * workers))
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_sign_worker,
+                                     initargs=(self,)) as executor:
+                for src_file, success in executor.map(_sign_one, jobs, chunksize=chunksize):
+                    results[src_file] = success
                 
         return results
 
 
+# One converter per worker process, set by the pool initializer
+_worker_converter = None
+
+def _init_sign_worker(converter):
+    global _worker_converter
+    _worker_converter = converter
+
+def _sign_one(job):
+    """Process-pool worker for FakeSignedELFConverter.sign_directory."""
+    src_file, dst_file = job
+    print(f'Signing: {src_file} -> {dst_file}')
+    return src_file, _worker_converter.sign_file(src_file, dst_file)
+
+
 # Utility functions for standalone use (kept for backward compatibility)
 def ensure_hex_string(val, **kwargs):
     exact_size = int(kwargs['exact_size']) if 'exact_size' in kwargs else None
@@ -846,6 +888,13 @@ def auth_info_type(val):
     return new_val
 
 
+def jobs_type(val):
+    new_val = try_parse_int(val, 10)
+    if new_val is None or new_val < 0:
+        raise argparse.ArgumentTypeError('invalid job count: {0}'.format(val))
+    return new_val
+
+
 class MyParser(argparse.ArgumentParser):
     def error(self, message):
         self.print_help()
@@ -874,6 +923,8 @@ def main():
                         help='firmware version')
     parser.add_argument('--auth-info', type=auth_info_type, default=None,
                         help='authentication info')
+    parser.add_argument('--jobs', '-j', type=jobs_type, default=1,
+                        help='worker processes for directory input (0 = one per CPU, default: 1)')
 
     if len(sys.argv) == 1:
         parser.print_usage()
@@ -920,7 +971,7 @@ def main():
         if not os.path.isdir(out_path):
             parser.error('When the input is a directory the output must also be a directory.')
         
-        results = converter.sign_directory(in_path, out_path)
+        results = converter.sign_directory(in_path, out_path, max_workers=args.jobs or None)
         successful = sum(1 for result in results.values() if result)
         total = len(results)
         print(f'\nSigning complete: {successful}/{total} files processed successfully')
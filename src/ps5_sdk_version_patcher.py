@@ -11,6 +11,7 @@ import struct
 import shutil
 import argparse
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Optional, Tuple, Union
 from pathlib import Path
 
@@ -69,6 +70,7 @@ SDK_VERSION_PAIRS_MAX = 10
 
 # Format map for reading/writing integers of different sizes
 FORMAT_MAP = {1: '<B', 2: '<H', 4: '<I', 8: '<Q'}
+STRUCT_MAP = {size: struct.Struct(fmt) for size, fmt in FORMAT_MAP.items()}
 
 
 class SDKVersionError(Exception):
@@ -129,7 +131,7 @@ class SDKVersionPatcher:
         if len(data) < size:
             raise SDKVersionError(f"Could not read {size} bytes at offset 0x{offset:X}")
         
-        return struct.unpack(FORMAT_MAP[size], data)[0]
+        return STRUCT_MAP[size].unpack(data)[0]
     
     def _write_le_int(self, file, offset: int, size: int, value: int):
         """
@@ -144,7 +146,7 @@ class SDKVersionPatcher:
         if size not in FORMAT_MAP:
             raise ValueError(f"Unsupported size: {size}. Must be 1, 2, 4, or 8 bytes.")
         
-        data = struct.pack(FORMAT_MAP[size], value)
+        data = STRUCT_MAP[size].pack(value)
         file.seek(offset)
         file.write(data)
     
@@ -307,12 +309,13 @@ class SDKVersionPatcher:
         
         return self._patch_file_internal(file_path)
     
-    def patch_directory(self, directory_path: str) -> Dict[str, Tuple[bool, str]]:
+    def patch_directory(self, directory_path: str, max_workers: Optional[int] = 1) -> Dict[str, Tuple[bool, str]]:
         """
         Recursively patch all ELF files in a directory.
         
         Args:
             directory_path: Path to the directory containing ELF files
+            max_workers: Worker processes to patch with (1 = in-process, None = one per CPU)
             
         Returns:
             Dictionary mapping file paths to (success, message) tuples
@@ -327,14 +330,26 @@ class SDKVersionPatcher:
             raise FileNotFoundError(f"Directory not found: '{directory_path}'")
         
         results = {}
+        file_paths = []
         
         # Walk through directory recursively
         for root, dirs, files in os.walk(directory_path):
             for filename in files:
                 if any(filename.endswith(ext) for ext in EXECUTABLE_EXTENSIONS):
-                    file_path = os.path.join(root, filename)
-                    success, message = self.patch_file(file_path)
-                    results[file_path] = (success, message)
+                    file_paths.append(os.path.join(root, filename))
+        
+        if max_workers == 1 or len(file_paths) < 2:
+            for file_path in file_paths:
+                success, message = self.patch_file(file_path)
+                results[file_path] = (success, message)
+        else:
+            # Each file is patched independently, so they can be spread over processes
+            workers = max_workers or os.cpu_count() or 1
+            chunksize = max(1, len(file_paths) // (4 * workers))
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_patch_worker,
+                                     initargs=(self,)) as executor:
+                for file_path, result in executor.map(_patch_one, file_paths, chunksize=chunksize):
+                    results[file_path] = result
         
         return results
     
@@ -342,6 +357,19 @@ class SDKVersionPatcher:
         """
         Set versions using a known SDK version pair.
         
+        Args:
+            pair_number: SDK version pair number (1-10)
+            
+        Raises:
+            ValueError: If pair_number is not in range
+        """
+        self.ps5_sdk_version, self.ps4_version = self.peek_versions(pair_number)
+    
+    @staticmethod
+    def peek_versions(pair_number: int) -> Tuple[int, int]:
+        """
+        Look up the (PS5 SDK version, PS4 version) of a known pair without creating a patcher.
+        
         Args:
             pair_number: SDK version pair number (1-10)
             
@@ -351,7 +379,7 @@ class SDKVersionPatcher:
         if pair_number not in SDK_VERSION_PAIRS:
             raise ValueError(f"Pair number must be between {SDK_VERSION_PAIRS_MIN} and {SDK_VERSION_PAIRS_MAX}")
         
-        self.ps5_sdk_version, self.ps4_version = SDK_VERSION_PAIRS[pair_number]
+        return SDK_VERSION_PAIRS[pair_number]
     
     def set_custom_versions(self, ps5_sdk_version: int, ps4_version: int):
         """
@@ -387,6 +415,26 @@ class SDKVersionPatcher:
         return SDK_VERSION_PAIRS_MIN, SDK_VERSION_PAIRS_MAX
 
 
+# The patcher each worker process was started with (see patch_directory)
+_worker_patcher = None
+
+def _init_patch_worker(patcher):
+    global _worker_patcher
+    _worker_patcher = patcher
+
+def _patch_one(file_path):
+    """Process-pool worker for SDKVersionPatcher.patch_directory."""
+    return file_path, _worker_patcher.patch_file(file_path)
+
+
+def jobs_type(val: str) -> int:
+    """Parse --jobs like the version options (int(x, 0)); 0 means one worker per CPU."""
+    jobs = int(val, 0)
+    if jobs < 0:
+        raise argparse.ArgumentTypeError(f"--jobs must not be negative: {val}")
+    return jobs
+
+
 def main():
     """Command-line interface for standalone use."""
     parser = argparse.ArgumentParser(description="Patches the SDK version PS5 ELF files")
@@ -399,6 +447,8 @@ def main():
                        help="(optional) Do not create backup .bak files")
     parser.add_argument("--no-colors", action="store_true",
                        help="(optional) Disable colored output")
+    parser.add_argument("--jobs", "-j", type=jobs_type, default=1,
+                       help="(optional) Worker processes for folder input (0 = one per CPU, default: 1)")
     
     args = parser.parse_args()
     
@@ -438,7 +488,7 @@ def main():
             print(message)
             sys.exit(1)
     elif os.path.isdir(input_path):
-        results = patcher.patch_directory(input_path)
+        results = patcher.patch_directory(input_path, max_workers=args.jobs or None)
         
         # Print summary
         successful = sum(1 for success, _ in results.values() if success)